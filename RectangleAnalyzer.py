@@ -1,54 +1,366 @@
+import hashlib
+import math
+import numbers
+import sys
 import warnings
 
+import numpy as np
+from numba import njit, prange
+
+
+def _source_hash() -> int:
+    """Stamp of this module's source, baked into the ahead-of-time build."""
+    with open(__file__, "rb") as f:
+        digest = hashlib.sha256(f.read()).digest()
+    return int.from_bytes(digest[:8], "little", signed=True)
+
+
+def _load_aot_kernels():
+    """The _rect_kernels build (see build_kernels.py) if it is current, else None."""
+    try:
+        import _rect_kernels
+    except ImportError:
+        return None
+    # A build from older source would run stale kernels; use the JIT instead
+    if _rect_kernels.source_hash() != _source_hash():
+        return None
+    return _rect_kernels
+
+
+_rect_kernels = _load_aot_kernels()
+
+
+def _eager_njit(signature, **options):
+    """
+    njit compiled for signature at import, moving the compile cost out of
+    the first query. When the precompiled build is loaded the JIT kernels
+    are only a fallback, so they are left lazy and cost nothing at import.
+    """
+    if _rect_kernels is not None:
+        return njit(**options)
+    return njit(signature, **options)
+
+
+@njit(cache=True, parallel=True)
+def _overlap_pairs(x, y, x2, y2, order):
+    """
+    Compiled pair scan over edge arrays already sorted by x, the sweep
+    axis; order maps sorted positions back to rectangle indices. Rows are
+    independent, so both passes run in parallel; each row writes only its
+    own slot in counts and its own slice of the output.
+    Returns: arrays (i, j, x, y, width, height) with one overlap region per
+    overlapping pair, i < j, in scan order
+    """
+    n = len(order)
+
+    # First pass counts hits per row so the output is allocated exactly once
+    counts = np.zeros(n, dtype=np.int64)
+    for p in prange(n):
+        for q in range(p + 1, n):
+            # Later rectangles start even further right, none can reach p
+            if x[q] >= x2[p]:
+                break
+            # Branch-free y test: both comparisons always run
+            if (y2[p] > y[q]) & (y2[q] > y[p]):
+                counts[p] += 1
+
+    starts = np.zeros(n + 1, dtype=np.int64)
+    starts[1:] = np.cumsum(counts)
+    total = starts[n]
+    i_out = np.empty(total, dtype=np.int64)
+    j_out = np.empty(total, dtype=np.int64)
+    rx = np.empty(total, dtype=x.dtype)
+    ry = np.empty(total, dtype=x.dtype)
+    rw = np.empty(total, dtype=x.dtype)
+    rh = np.empty(total, dtype=x.dtype)
+
+    for p in prange(n):
+        k = starts[p]
+        for q in range(p + 1, n):
+            if x[q] >= x2[p]:
+                break
+            if (y2[p] > y[q]) & (y2[q] > y[p]):
+                i_out[k] = min(order[p], order[q])
+                j_out[k] = max(order[p], order[q])
+                rx[k] = max(x[p], x[q])
+                ry[k] = max(y[p], y[q])
+                rw[k] = min(x2[p], x2[q]) - rx[k]
+                rh[k] = min(y2[p], y2[q]) - ry[k]
+                k += 1
+
+    return i_out, j_out, rx, ry, rw, rh
+
+
+@njit(cache=True)
+def _covers_point(x, y, x2, y2, px_lo, px_hi, py_lo, py_hi):
+    """
+    Whether any rectangle contains the query point, stopping at the first
+    hit. The point is passed as bounds: rectangle k contains it when
+    x[k] <= px_lo and px_hi <= x2[k], and likewise for y. An exact point
+    is its own bounds; see RectangleAnalyzer._integer_bounds for the rest.
+    """
+    for k in range(len(x)):
+        if x[k] <= px_lo and px_hi <= x2[k] and y[k] <= py_lo and py_hi <= y2[k]:
+            return True
+    return False
+
+
+@njit(cache=True)
+def _covers_points(x, y, x2, y2, px_lo, px_hi, py_lo, py_hi):
+    """Elementwise _covers_point over arrays of query point bounds."""
+    covered = np.empty(len(px_lo), dtype=np.bool_)
+    for m in range(len(px_lo)):
+        covered[m] = _covers_point(x, y, x2, y2, px_lo[m], px_hi[m], py_lo[m], py_hi[m])
+    return covered
+
+
+def _kernel(jit_kernel, dtype):
+    """Precompiled build of jit_kernel for dtype if available, else jit_kernel."""
+    name = f"{jit_kernel.__name__.lstrip('_')}_{np.dtype(dtype).str[1:]}"
+    return getattr(_rect_kernels, name, jit_kernel)
+
+
+@_eager_njit(
+    "void(i8[::1], f8[::1], f8[::1], i8, i8, i8, i8, i8, i8)",
+    cache=True,
+    boundscheck=False,
+)
+def _cover_update(count, covered, ys, node, left, right, lo, hi, delta):
+    """
+    Add delta to the cover count of leaves [lo, hi) in the segment tree
+    subtree node spanning leaves [left, right), keeping covered[node] as
+    the length of ys covered by at least one active interval.
+    """
+    if lo <= left and right <= hi:
+        count[node] += delta
+    else:
+        mid = (left + right) // 2
+        if lo < mid:
+            _cover_update(count, covered, ys, 2 * node, left, mid, lo, hi, delta)
+        if mid < hi:
+            _cover_update(count, covered, ys, 2 * node + 1, mid, right, lo, hi, delta)
+
+    if count[node] > 0:
+        covered[node] = ys[right] - ys[left]
+    elif right - left == 1:
+        covered[node] = 0.0
+    else:
+        covered[node] = covered[2 * node] + covered[2 * node + 1]
+
+
+@_eager_njit(
+    "f8(f8[::1], i8[::1], i8[::1], i8[::1], f8[::1])",
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+)
+def _coverage_area(event_x, delta, lo, hi, ys):
+    """Union area from x-sorted edge events, summing covered strips."""
+    leaves = len(ys) - 1
+    count = np.zeros(4 * max(leaves, 1), dtype=np.int64)
+    covered = np.zeros(4 * max(leaves, 1), dtype=np.float64)
+
+    total = 0.0
+    for k in range(len(event_x)):
+        if k > 0:
+            total += (event_x[k] - event_x[k - 1]) * covered[1]
+        _cover_update(count, covered, ys, 1, 0, leaves, lo[k], hi[k], delta[k])
+    return total
+
+
+@_eager_njit(
+    "void(i8[::1], i8[::1], i8, i8, i8, i8, i8, i8)", cache=True, boundscheck=False
+)
+def _depth_update(add, best, node, left, right, lo, hi, delta):
+    """
+    Add delta to the depth of leaves [lo, hi) in the segment tree subtree
+    node spanning leaves [left, right), keeping best[node] as the largest
+    depth of any leaf in it.
+    """
+    if lo <= left and right <= hi:
+        add[node] += delta
+        best[node] += delta
+        return
+
+    mid = (left + right) // 2
+    if lo < mid:
+        _depth_update(add, best, 2 * node, left, mid, lo, hi, delta)
+    if mid < hi:
+        _depth_update(add, best, 2 * node + 1, mid, right, lo, hi, delta)
+    best[node] = add[node] + max(best[2 * node], best[2 * node + 1])
+
+
+@_eager_njit(
+    "UniTuple(i8, 3)(f8[::1], i8[::1], i8[::1], i8[::1], i8)",
+    cache=True,
+    boundscheck=False,
+)
+def _max_depth(event_x, delta, lo, hi, leaves):
+    """
+    Deepest cell from x-sorted edge events over the given number of
+    elementary y-intervals.
+    Returns: (k, leaf, depth) for the first deepest cell in x-then-y order,
+    lying between event_x[k] and event_x[k + 1] in elementary y-interval leaf
+    """
+    add = np.zeros(4 * max(leaves, 1), dtype=np.int64)
+    best = np.zeros(4 * max(leaves, 1), dtype=np.int64)
+
+    n = len(event_x)
+    best_k, best_leaf, best_depth = 0, 0, 0
+    for k in range(n):
+        _depth_update(add, best, 1, 0, leaves, lo[k], hi[k], delta[k])
+        # After the last event at x, the tree holds the depths of the
+        # stripe up to the next event
+        if k + 1 < n and event_x[k + 1] > event_x[k] and best[1] > best_depth:
+            # Descend to the lowest leaf reaching the root's depth
+            node, left, right = 1, 0, leaves
+            while right - left > 1:
+                mid = (left + right) // 2
+                if best[2 * node] >= best[2 * node + 1]:
+                    node, right = 2 * node, mid
+                else:
+                    node, left = 2 * node + 1, mid
+            best_k, best_leaf, best_depth = k, left, best[1]
+
+    return best_k, best_leaf, best_depth
+
 
 class RectangleAnalyzer:
+    # No per-instance __dict__: the analyzer is a fixed set of arrays
+    __slots__ = (
+        "_coverage_cache",
+        "_h",
+        "_max_overlap_cache",
+        "_order_x",
+        "_order_y",
+        "_pair_cache",
+        "_w",
+        "_x",
+        "_x2",
+        "_y",
+        "_y2",
+        "rectangles",
+    )
+
     def __init__(self, rectangles: list[dict]):
-        """Initialize analyzer with list of rectangles."""
+        """
+        Initialize analyzer with list of rectangles.
+        The list is treated as immutable: query results are computed on
+        first use and cached, so it must not be changed afterwards.
+        """
+        # Only a reference to the caller's list is kept, for the user-facing
+        # API and messages; all queries run on the arrays below
         self.rectangles = rectangles
         self._validate_rectangles()
 
+        # _validate_rectangles loaded x, y, width and height as arrays
+        self._x2 = self._x + self._w
+        self._y2 = self._y + self._h
+
+        # Spatial index: rectangles ordered by left and by bottom edge. The
+        # pair scan sweeps along either axis, visiting only rectangles whose
+        # extent on that axis can reach the current one
+        # Indices are int64 like every kernel index, not platform intp
+        self._order_x = np.argsort(self._x, kind="stable").astype(np.int64)
+        self._order_y = np.argsort(self._y, kind="stable").astype(np.int64)
+
+        self._pair_cache = None
+        self._coverage_cache = None
+        self._max_overlap_cache = None
+
     def _validate_rectangles(self):
-        """Validate rectangle data."""
+        """Validate rectangle data and load it into coordinate arrays."""
+        required = {"x", "y", "width", "height"}
         for i, rect in enumerate(self.rectangles):
             # Check required keys
-            required = {"x", "y", "width", "height"}
             if not required.issubset(rect.keys()):
                 raise ValueError(
                     f"Rectangle {i} missing required keys: {required - rect.keys()}"
                 )
 
-            # Check for valid numeric values
-            for key in required:
-                if not isinstance(rect[key], (int, float)):
-                    raise TypeError(f"Rectangle {i} has non-numeric {key}: {rect[key]}")
-
-            # Check for non-negative dimensions
-            if rect["width"] < 0 or rect["height"] < 0:
-                raise ValueError(f"Rectangle {i} has negative dimensions")
-
-            # Check for zero-area rectangles
-            if rect["width"] == 0 or rect["height"] == 0:
-                raise ValueError(f"Rectangle {i} has zero area")
+        # Check for valid numeric values, one column at a time
+        columns = {}
+        for key in ("x", "y", "width", "height"):
+            values = [rect[key] for rect in self.rectangles]
+            try:
+                column = np.array(values)
+            except ValueError:
+                # Ragged input, e.g. a list among numbers
+                column = None
+            if column is None or column.ndim != 1 or column.dtype.kind not in "biuf":
+                # Slow path: find the offender, or accept ints too big for int64
+                for i, value in enumerate(values):
+                    if not isinstance(value, (int, float)):
+                        raise TypeError(f"Rectangle {i} has non-numeric {key}: {value}")
+                    if isinstance(value, int) and abs(value) > sys.float_info.max:
+                        raise ValueError(
+                            f"Rectangle {i} has {key} beyond the float64 range"
+                        )
+                column = np.asarray(values, dtype=np.float64)
+            columns[key] = column
+
+        # Integer-only input stays exact in the narrowest integer dtype that
+        # holds every edge; anything else, including integer edges beyond
+        # int64, is float64 and exact only as far as float64 is
+        dtype = np.float64
+        if all(column.dtype.kind in "biu" for column in columns.values()):
+            # Bound the edges with Python ints, which cannot wrap
+            bounds = {
+                key: (int(column.min()), int(column.max()))
+                for key, column in columns.items()
+            }
+            low, high = [], []
+            for key, size in (("x", "width"), ("y", "height")):
+                (lo, hi), (size_lo, size_hi) = bounds[key], bounds[size]
+                low.append(min(lo, lo + size_lo))
+                high.append(max(hi, hi + size_hi))
+            # Edges and the spread between them, which bounds every width and
+            # height, must fit so that the sweeps take exact differences
+            spread = max(h - l for l, h in zip(low, high))
+            for candidate in (np.int32, np.int64):
+                info = np.iinfo(candidate)
+                if (
+                    min(low) >= info.min
+                    and max(high) <= info.max
+                    and spread <= info.max
+                ):
+                    dtype = candidate
+                    break
+
+        self._x = columns["x"].astype(dtype)
+        self._y = columns["y"].astype(dtype)
+        self._w = columns["width"].astype(dtype)
+        self._h = columns["height"].astype(dtype)
+
+        # Check for non-negative dimensions
+        bad = np.flatnonzero((self._w < 0) | (self._h < 0))
+        if bad.size:
+            raise ValueError(f"Rectangle {bad[0]} has negative dimensions")
+
+        # Check for zero-area rectangles
+        bad = np.flatnonzero((self._w == 0) | (self._h == 0))
+        if bad.size:
+            raise ValueError(f"Rectangle {bad[0]} has zero area")
 
         # Check for identical rectangles
         self._check_identical_rectangles()
 
     def _check_identical_rectangles(self):
         """Check for and warn about identical rectangles."""
-        seen = {}
-        for i, rect in enumerate(self.rectangles):
-            # Create a hashable key from rectangle properties
-            key = (rect["x"], rect["y"], rect["width"], rect["height"])
-
-            if key in seen:
-                warnings.warn(
-                    f"Rectangle {i} is identical to rectangle {seen[key]}: "
-                    f"x={rect['x']}, y={rect['y']}, width={rect['width']}, height={rect['height']}",
-                    UserWarning,
-                    stacklevel=3,
-                )
-            else:
-                seen[key] = i
+        stacked = np.stack((self._x, self._y, self._w, self._h), axis=1)
+        _, first, inverse = np.unique(
+            stacked, axis=0, return_index=True, return_inverse=True
+        )
+        # Every rectangle that is not the first of its group is a duplicate
+        first = first[inverse.reshape(-1)]
+        for i in np.flatnonzero(first != np.arange(len(first))).tolist():
+            rect = self.rectangles[i]
+            warnings.warn(
+                f"Rectangle {i} is identical to rectangle {first[i]}: "
+                f"x={rect['x']}, y={rect['y']}, width={rect['width']}, height={rect['height']}",
+                UserWarning,
+                stacklevel=3,
+            )
 
     def find_overlaps(self) -> list[tuple]:
         """
@@ -56,22 +368,49 @@ class RectangleAnalyzer:
         Returns: List of tuples (i, j) where i < j are indices
         Example: [(0, 1), (0, 2), (1, 2)]
         """
-        overlaps = []
-        for i in range(len(self.rectangles)):
-            for j in range(i + 1, len(self.rectangles)):
-                if self._rectangles_overlap(self.rectangles[i], self.rectangles[j]):
-                    overlaps.append((i, j))
-        return overlaps
-
-    def _rectangles_overlap(self, r1: dict, r2: dict) -> bool:
-        """Helper method to check if two given rectangles overlap."""
-        # No overlap if one rectangle is to the left of the other
-        if r1["x"] + r1["width"] <= r2["x"] or r2["x"] + r2["width"] <= r1["x"]:
-            return False
-        # No overlap if one rectangle is above the other
-        if r1["y"] + r1["height"] <= r2["y"] or r2["y"] + r2["height"] <= r1["y"]:
-            return False
-        return True
+        scan = self._pair_scan()
+        return list(zip(scan["i"].tolist(), scan["j"].tolist()))
+
+    def _pair_scan(self) -> dict:
+        """
+        Overlapping pairs and their overlap regions, found in a single pass.
+        Computed once and cached; callers must not modify the arrays.
+        Returns: dict of equal-length arrays 'i', 'j', 'x', 'y', 'width',
+        'height', one entry per overlapping pair, sorted by (i, j)
+        """
+        if self._pair_cache is None:
+            # Sweep along the axis that leaves fewer candidate pairs
+            x_pairs = self._sweep_candidates(self._x, self._x2, self._order_x)
+            y_pairs = self._sweep_candidates(self._y, self._y2, self._order_y)
+            sweep_x = x_pairs <= y_pairs
+            if sweep_x:
+                order = self._order_x
+                edges = (self._x, self._y, self._x2, self._y2)
+            else:
+                # Sweep along y by passing the axes swapped
+                order = self._order_y
+                edges = (self._y, self._x, self._y2, self._x2)
+            i, j, lo, other_lo, size, other_size = _overlap_pairs(
+                *(edge[order] for edge in edges), order
+            )
+            if sweep_x:
+                columns = (i, j, lo, other_lo, size, other_size)
+            else:
+                columns = (i, j, other_lo, lo, other_size, size)
+            # Report pairs in (i, j) order regardless of scan order
+            by_pair = np.lexsort((columns[1], columns[0]))
+            keys = ("i", "j", "x", "y", "width", "height")
+            self._pair_cache = {
+                key: column[by_pair] for key, column in zip(keys, columns)
+            }
+        return self._pair_cache
+
+    @staticmethod
+    def _sweep_candidates(lo, hi, order) -> int:
+        """Number of pairs a sweep over order along the lo/hi axis visits."""
+        # Each rectangle is paired with the later ones starting before its end
+        ends = np.searchsorted(lo[order], hi[order], side="left")
+        return int(np.sum(ends - np.arange(1, len(order) + 1)))
 
     def calculate_coverage_area(self) -> float:
         """
@@ -79,43 +418,49 @@ class RectangleAnalyzer:
         Overlapping areas should be counted only once.
         Returns: float/int representing total area
         """
-        if not self.rectangles:
+        if self._coverage_cache is None:
+            self._coverage_cache = self._sweep_coverage()
+        return self._coverage_cache
+
+    def _sweep_coverage(self) -> float:
+        """Union area of all rectangles via a sweep line over x."""
+        if not len(self._x):
             return 0.0
 
-        # Collect all unique x and y coordinates
-        x_coords = set()
-        y_coords = set()
-
-        for rect in self.rectangles:
-            x_coords.add(rect["x"])
-            x_coords.add(rect["x"] + rect["width"])
-            y_coords.add(rect["y"])
-            y_coords.add(rect["y"] + rect["height"])
-
-        x_coords = sorted(x_coords)
-        y_coords = sorted(y_coords)
-
-        # Calculate area by checking each cell in the grid
-        total_area = 0.0
-        for i in range(len(x_coords) - 1):
-            for j in range(len(y_coords) - 1):
-                cell_x = x_coords[i]
-                cell_y = y_coords[j]
-                cell_width = x_coords[i + 1] - x_coords[i]
-                cell_height = y_coords[j + 1] - y_coords[j]
-
-                # Check if this cell is covered by any rectangle
-                for rect in self.rectangles:
-                    if (
-                        rect["x"] <= cell_x
-                        and cell_x + cell_width <= rect["x"] + rect["width"]
-                        and rect["y"] <= cell_y
-                        and cell_y + cell_height <= rect["y"] + rect["height"]
-                    ):
-                        total_area += cell_width * cell_height
-                        break
-
-        return total_area
+        x, delta, lo, hi, ys = self._edge_events()
+        # The kernel is compiled for float64 only; areas are floats anyway
+        coverage_area = _kernel(_coverage_area, np.float64)
+        return coverage_area(self._float_edges(x), delta, lo, hi, self._float_edges(ys))
+
+    @staticmethod
+    def _float_edges(edges: np.ndarray) -> np.ndarray:
+        """
+        Sorted edges as float64 for the sweep kernels, which only use their
+        order and differences. Integer edges are taken relative to the first
+        one in int64, so they convert exactly unless they span more than 2**53.
+        """
+        if edges.dtype.kind == "i":
+            edges = edges.astype(np.int64) - edges[0]
+        return edges.astype(np.float64)
+
+    def _edge_events(self) -> tuple:
+        """
+        Vertical edge events for the sweep lines, sorted by x.
+        Returns: (x, delta, lo, hi, ys) where delta is +1 for a left edge and
+        -1 for a right edge, and [lo, hi) are the elementary y-intervals of
+        the rectangle between the sorted unique y coordinates ys
+        """
+        # Compress y coordinates so each leaf is one elementary y-interval
+        ys = np.unique(np.concatenate((self._y, self._y2)))
+        # Kernel signatures take int64; searchsorted gives intp, which is
+        # int32 on Windows with NumPy < 2
+        lo = np.searchsorted(ys, self._y).astype(np.int64)
+        hi = np.searchsorted(ys, self._y2).astype(np.int64)
+
+        x = np.concatenate((self._x, self._x2))
+        delta = np.repeat(np.array([1, -1], dtype=np.int64), len(self._x))
+        by_x = np.argsort(x, kind="stable")
+        return x[by_x], delta[by_x], np.tile(lo, 2)[by_x], np.tile(hi, 2)[by_x], ys
 
     def get_overlap_regions(self) -> list[dict]:
         """
@@ -124,40 +469,133 @@ class RectangleAnalyzer:
         - 'rect_indices': tuple of rectangle indices
         - 'region': dict with x, y, width, height of overlap
         """
-        overlap_regions = []
-        for i in range(len(self.rectangles)):
-            for j in range(i + 1, len(self.rectangles)):
-                region = self._get_overlap_region(
-                    self.rectangles[i], self.rectangles[j]
-                )
-                if region:
-                    overlap_regions.append({"rect_indices": (i, j), "region": region})
-        return overlap_regions
-
-    def _get_overlap_region(self, r1: dict, r2: dict) -> dict | None:
-        """Helper method to get the overlap region between two rectangles."""
-        if not self._rectangles_overlap(r1, r2):
-            return None
-
-        x = max(r1["x"], r2["x"])
-        y = max(r1["y"], r2["y"])
-        x_max = min(r1["x"] + r1["width"], r2["x"] + r2["width"])
-        y_max = min(r1["y"] + r1["height"], r2["y"] + r2["height"])
-
-        return {"x": x, "y": y, "width": x_max - x, "height": y_max - y}
+        scan = self._pair_scan()
+        columns = zip(
+            scan["i"].tolist(),
+            scan["j"].tolist(),
+            scan["x"].tolist(),
+            scan["y"].tolist(),
+            scan["width"].tolist(),
+            scan["height"].tolist(),
+        )
+        return [
+            {
+                "rect_indices": (i, j),
+                "region": {"x": x, "y": y, "width": width, "height": height},
+            }
+            for i, j, x, y, width, height in columns
+        ]
+
+    def get_overlap_region_arrays(self) -> dict:
+        """
+        Overlap regions as columns rather than one dict per pair.
+        Returns: dict of NumPy arrays 'i', 'j', 'x', 'y', 'width', 'height';
+        entry k is the overlap of rectangles i[k] < j[k], sorted by (i, j)
+        """
+        return {key: column.copy() for key, column in self._pair_scan().items()}
 
     def is_point_covered(self, x: int | float, y: int | float) -> bool:
         """
         Check if a point is covered by any rectangle.
         Returns: boolean
         """
-        for rect in self.rectangles:
-            if (
-                rect["x"] <= x <= rect["x"] + rect["width"]
-                and rect["y"] <= y <= rect["y"] + rect["height"]
-            ):
-                return True
-        return False
+        for value in (x, y):
+            if not isinstance(value, numbers.Real):
+                raise TypeError(f"Point coordinate is not numeric: {value!r}")
+
+        if self._x.dtype.kind == "i":
+            # Compare in int64: integer edges beyond 2**53 round as floats
+            bounds = (self._integer_bounds(x), self._integer_bounds(y))
+            if None in bounds:
+                return False
+            query = [np.int64(bound) for bound in bounds[0] + bounds[1]]
+        else:
+            x, y = self._float_query(x), self._float_query(y)
+            query = [x, x, y, y]
+        covers_point = _kernel(_covers_point, self._x.dtype)
+        return bool(covers_point(self._x, self._y, self._x2, self._y2, *query))
+
+    @staticmethod
+    def _float_query(value) -> float:
+        """A query coordinate as a float, with ints past its range at +-inf."""
+        try:
+            return float(value)
+        except OverflowError:
+            # math.copysign would convert the int to float and overflow too
+            return math.inf if value > 0 else -math.inf
+
+    @staticmethod
+    def _integer_bounds(value) -> tuple[int, int] | None:
+        """
+        Floor and ceil of a query coordinate, which compare exactly against
+        integer edges e: e <= value iff e <= floor, and value <= e iff
+        ceil <= e.
+        Returns: (floor, ceil), or None if value is NaN or outside int64,
+        where no integer rectangle can contain it
+        """
+        if isinstance(value, numbers.Integral):
+            lo = hi = int(value)
+        elif math.isfinite(value):
+            lo, hi = math.floor(value), math.ceil(value)
+        else:
+            return None
+        int64 = np.iinfo(np.int64)
+        if lo < int64.min or hi > int64.max:
+            return None
+        return lo, hi
+
+    def is_points_covered(self, xs, ys) -> np.ndarray:
+        """
+        Check many points at once; xs and ys are broadcast together.
+        Returns: boolean array, True where the point is covered
+        """
+        xs, ys = np.broadcast_arrays(np.asarray(xs), np.asarray(ys))
+        x_lo, x_hi, x_valid = self._query_bounds(xs.ravel())
+        y_lo, y_hi, y_valid = self._query_bounds(ys.ravel())
+        covers_points = _kernel(_covers_points, self._x.dtype)
+        covered = covers_points(
+            self._x, self._y, self._x2, self._y2, x_lo, x_hi, y_lo, y_hi
+        )
+        return (covered & x_valid & y_valid).reshape(xs.shape)
+
+    def _query_bounds(self, values: np.ndarray) -> tuple:
+        """
+        Array form of the query conversion in is_point_covered: float64 for
+        float storage, int64 floor and ceil for integer storage.
+        Returns: (lo, hi, valid) where valid is False for queries no
+        rectangle can contain
+        """
+        kind = values.dtype.kind
+        if kind == "O":
+            # Python ints beyond uint64, possibly mixed with other numbers
+            for value in values.tolist():
+                if not isinstance(value, numbers.Real):
+                    raise TypeError(f"Point coordinate is not numeric: {value!r}")
+        elif kind not in "biuf":
+            raise TypeError(f"Point coordinates are not numeric: {values.dtype}")
+
+        if self._x.dtype.kind != "i":
+            if kind == "O":
+                values = [self._float_query(value) for value in values.tolist()]
+            values = np.asarray(values, dtype=np.float64)
+            return values, values, np.ones(len(values), dtype=np.bool_)
+
+        if kind == "O":
+            bounds = [self._integer_bounds(value) for value in values.tolist()]
+            valid = np.array([bound is not None for bound in bounds], dtype=np.bool_)
+            pairs = [bound or (0, 0) for bound in bounds]
+            pairs = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+            return pairs[:, 0], pairs[:, 1], valid
+        if kind == "f":
+            lo, hi = np.floor(values), np.ceil(values)
+            # NaN fails both tests; 2.0**63 is just past int64.max
+            valid = (lo >= -(2.0**63)) & (hi < 2.0**63)
+        else:
+            lo = hi = values
+            valid = values <= np.iinfo(np.int64).max
+        lo = np.where(valid, lo, 0).astype(np.int64)
+        hi = np.where(valid, hi, 0).astype(np.int64)
+        return lo, hi, valid
 
     def find_max_overlap_point(self) -> dict:
         """
@@ -165,44 +603,26 @@ class RectangleAnalyzer:
         Returns: dict with 'x', 'y', 'count' keys
         Note: There might be multiple such points, return any one.
         """
-        if not self.rectangles:
-            return {"x": 0, "y": 0, "count": 0}
+        if self._max_overlap_cache is None:
+            self._max_overlap_cache = self._sweep_max_overlap()
+        return dict(self._max_overlap_cache)
 
-        # Collect all unique x and y coordinates
-        x_coords = set()
-        y_coords = set()
-
-        for rect in self.rectangles:
-            x_coords.add(rect["x"])
-            x_coords.add(rect["x"] + rect["width"])
-            y_coords.add(rect["y"])
-            y_coords.add(rect["y"] + rect["height"])
-
-        x_coords = sorted(x_coords)
-        y_coords = sorted(y_coords)
-
-        # Check center of each cell for maximum overlap
-        max_count = 0
-        max_point = {"x": 0, "y": 0, "count": 0}
-
-        for i in range(len(x_coords) - 1):
-            for j in range(len(y_coords) - 1):
-                # Use center of cell
-                test_x = (x_coords[i] + x_coords[i + 1]) / 2
-                test_y = (y_coords[j] + y_coords[j + 1]) / 2
-
-                count = sum(
-                    1
-                    for rect in self.rectangles
-                    if rect["x"] <= test_x <= rect["x"] + rect["width"]
-                    and rect["y"] <= test_y <= rect["y"] + rect["height"]
-                )
+    def _sweep_max_overlap(self) -> dict:
+        """Deepest point of the rectangle stack via a sweep line over x."""
+        if not len(self._x):
+            return {"x": 0, "y": 0, "count": 0}
 
-                if count > max_count:
-                    max_count = count
-                    max_point = {"x": test_x, "y": test_y, "count": count}
+        x, delta, lo, hi, ys = self._edge_events()
+        max_depth = _kernel(_max_depth, np.float64)
+        k, leaf, count = max_depth(self._float_edges(x), delta, lo, hi, len(ys) - 1)
 
-        return max_point
+        x_left, x_right = x[k : k + 2].tolist()
+        y_low, y_high = ys[leaf : leaf + 2].tolist()
+        return {
+            "x": (x_left + x_right) / 2,
+            "y": (y_low + y_high) / 2,
+            "count": count,
+        }
 
     def get_stats(self) -> dict:
         """
@@ -214,21 +634,17 @@ class RectangleAnalyzer:
         - 'overlap_area': float (sum of all overlap regions)
         - 'coverage_efficiency': float (total_area / sum_of_individual_areas)
         """
-        total_rectangles = len(self.rectangles)
-        overlapping_pairs = len(self.find_overlaps())
+        total_rectangles = len(self._x)
+        scan = self._pair_scan()
+        overlapping_pairs = len(scan["i"])
         total_area = self.calculate_coverage_area()
 
-        # Calculate overlap area (sum of all overlap regions)
-        overlap_regions = self.get_overlap_regions()
-        overlap_area = sum(
-            region["region"]["width"] * region["region"]["height"]
-            for region in overlap_regions
-        )
+        # Calculate overlap area (sum of all overlap regions); products of
+        # integer extents can overflow, so multiply as floats
+        overlap_area = float(np.dot(scan["width"].astype(np.float64), scan["height"]))
 
         # Calculate sum of individual areas
-        sum_of_individual_areas = sum(
-            rect["width"] * rect["height"] for rect in self.rectangles
-        )
+        sum_of_individual_areas = float(np.sum(self._w.astype(np.float64) * self._h))
 
         # Calculate coverage efficiency
         coverage_efficiency = (
@@ -0,0 +1,53 @@
+"""
+Ahead-of-time build of the RectangleAnalyzer kernels.
+
+Run `python build_kernels.py` (or `pixi run build-kernels`) to produce the
+_rect_kernels extension module next to RectangleAnalyzer.py. When present,
+RectangleAnalyzer uses it instead of JIT-compiling those kernels, as long as
+RectangleAnalyzer.py is unchanged since the build.
+
+The overlap pair scan is left out: pycc compiles prange as a plain range,
+so it stays on the parallel JIT path and always pays its JIT compile cost.
+"""
+
+from numba.pycc import CC
+
+from RectangleAnalyzer import (
+    _coverage_area,
+    _covers_point,
+    _covers_points,
+    _max_depth,
+    _source_hash,
+)
+
+cc = CC("_rect_kernels")
+
+SOURCE_HASH = _source_hash()
+
+
+def source_hash():
+    return SOURCE_HASH
+
+
+cc.export("source_hash", "i8()")(source_hash)
+
+cc.export("coverage_area_f8", "f8(f8[::1], i8[::1], i8[::1], i8[::1], f8[::1])")(
+    _coverage_area.py_func
+)
+cc.export("max_depth_f8", "UniTuple(i8, 3)(f8[::1], i8[::1], i8[::1], i8[::1], i8)")(
+    _max_depth.py_func
+)
+
+# One export per coordinate dtype RectangleAnalyzer can store; integer
+# storage takes its point queries in int64
+for t, q in (("f8", "f8"), ("i4", "i8"), ("i8", "i8")):
+    coords = f"{t}[:], {t}[:], {t}[:], {t}[:]"
+    cc.export(f"covers_point_{t}", f"b1({coords}, {q}, {q}, {q}, {q})")(
+        _covers_point.py_func
+    )
+    cc.export(f"covers_points_{t}", f"b1[:]({coords}, {q}[:], {q}[:], {q}[:], {q}[:])")(
+        _covers_points.py_func
+    )
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,5 +1,9 @@
 import pytest
+import sys
+import types
 import warnings
+import numpy as np
+import RectangleAnalyzer as analyzer_module
 from RectangleAnalyzer import RectangleAnalyzer
 
 
@@ -14,6 +18,43 @@ def test_find_overlaps():
     assert overlaps == [(0, 1)]
 
 
+def test_find_overlaps_matches_pairwise_check():
+    """Test the overlap scan against a plain pairwise check."""
+    rectangles = [
+        {"x": (i * 7) % 11, "y": (i * 5) % 13, "width": 1 + i % 4, "height": 2 + i % 3}
+        for i in range(30)
+    ]
+
+    def overlap(r1, r2):
+        return (
+            r1["x"] < r2["x"] + r2["width"]
+            and r2["x"] < r1["x"] + r1["width"]
+            and r1["y"] < r2["y"] + r2["height"]
+            and r2["y"] < r1["y"] + r1["height"]
+        )
+
+    expected = [
+        (i, j)
+        for i in range(len(rectangles))
+        for j in range(i + 1, len(rectangles))
+        if overlap(rectangles[i], rectangles[j])
+    ]
+    assert RectangleAnalyzer(rectangles).find_overlaps() == expected
+
+
+def test_find_overlaps_stacked_strips():
+    """Test strips that all share an x-range but only touch neighbours in y."""
+    rectangles = [{"x": 0, "y": 2 * i, "width": 100, "height": 2.5} for i in range(10)]
+    analyzer = RectangleAnalyzer(rectangles)
+    assert analyzer.find_overlaps() == [(i, i + 1) for i in range(9)]
+    assert analyzer.get_overlap_regions()[3]["region"] == {
+        "x": 0.0,
+        "y": 8.0,
+        "width": 100.0,
+        "height": 0.5,
+    }
+
+
 def test_find_overlaps_no_overlap():
     """Test with non-overlapping rectangles."""
     rectangles = [
@@ -38,6 +79,19 @@ def test_calculate_coverage_area():
     assert total_area == 17.0
 
 
+def test_calculate_coverage_area_nested_and_chained():
+    """Test union area with nested, chained and disjoint rectangles."""
+    rectangles = [
+        {"x": 0, "y": 0, "width": 10, "height": 10},
+        {"x": 2, "y": 2, "width": 3, "height": 3},  # Inside the first
+        {"x": 8, "y": 8, "width": 4, "height": 4},  # Sticks out by 12
+        {"x": 11, "y": 5, "width": 2, "height": 4},  # Overlaps the third by 1
+        {"x": 20, "y": 20, "width": 1.5, "height": 2},  # Disjoint
+    ]
+    analyzer = RectangleAnalyzer(rectangles)
+    assert analyzer.calculate_coverage_area() == pytest.approx(100 + 12 + 7 + 3)
+
+
 def test_get_overlap_regions():
     """Test getting overlap regions."""
     rectangles = [
@@ -51,6 +105,27 @@ def test_get_overlap_regions():
     assert overlap_regions[0]["region"] == {"x": 2, "y": 1, "width": 2, "height": 2}
 
 
+def test_get_overlap_region_arrays():
+    """Test columnar overlap regions match the per-pair dicts."""
+    rectangles = [
+        {"x": 0, "y": 0, "width": 4, "height": 3},
+        {"x": 2, "y": 1, "width": 3, "height": 3},
+        {"x": 5, "y": 0, "width": 1, "height": 1},  # Only touches the second
+    ]
+    analyzer = RectangleAnalyzer(rectangles)
+    arrays = analyzer.get_overlap_region_arrays()
+    assert arrays["i"].tolist() == [0]
+    assert arrays["j"].tolist() == [1]
+    assert arrays["x"].tolist() == [2]
+    assert arrays["y"].tolist() == [1]
+    assert arrays["width"].tolist() == [2]
+    assert arrays["height"].tolist() == [2]
+
+    # Returned arrays are copies, so editing them leaves the analyzer intact
+    arrays["width"][0] = 100
+    assert analyzer.get_overlap_regions()[0]["region"]["width"] == 2
+
+
 def test_is_point_covered():
     """Test checking if a point is covered."""
     rectangles = [
@@ -61,6 +136,69 @@ def test_is_point_covered():
     assert analyzer.is_point_covered(3, 2) is True
     assert analyzer.is_point_covered(10, 10) is False
 
+    # Huge ints are outside every rectangle rather than rejected by the kernel
+    assert analyzer.is_point_covered(2**70, 0) is False
+    assert analyzer.is_point_covered(10**400, 0) is False
+
+    # Likewise with float rectangles, even past the float64 range
+    floats = RectangleAnalyzer([{"x": 0.5, "y": 0, "width": 1, "height": 1}])
+    assert floats.is_point_covered(1, 0.5) is True
+    assert floats.is_point_covered(10**400, 0.5) is False
+    assert floats.is_point_covered(-(10**400), 0.5) is False
+
+    with pytest.raises(TypeError):
+        analyzer.is_point_covered(None, 0)
+    with pytest.raises(TypeError):
+        analyzer.is_point_covered("3", 0)
+
+
+def test_is_point_covered_int64_exact():
+    """Test point queries against int64 rectangles do not round."""
+    analyzer = RectangleAnalyzer([{"x": 2**60 + 1, "y": 0, "width": 1, "height": 1}])
+    assert analyzer.is_point_covered(2**60, 0.5) is False
+    assert analyzer.is_point_covered(2**60 + 1, 0.5) is True
+    assert analyzer.is_point_covered(2**60 + 2, 1) is True
+    assert analyzer.is_point_covered(2**60 + 3, 0.5) is False
+    assert analyzer.is_point_covered(float(2**60), 0.5) is False
+    assert analyzer.is_point_covered(2**60 + 1, float("nan")) is False
+
+
+def test_is_points_covered():
+    """Test batched point coverage matches single point queries."""
+    rectangles = [
+        {"x": 0, "y": 0, "width": 4, "height": 3},
+        {"x": 2, "y": 1, "width": 3, "height": 3},
+    ]
+    analyzer = RectangleAnalyzer(rectangles)
+    xs = [3, 10, 4, 5, -1]
+    ys = [2, 10, 3, 4, 0]
+    covered = analyzer.is_points_covered(xs, ys)
+    assert covered.tolist() == [analyzer.is_point_covered(x, y) for x, y in zip(xs, ys)]
+    assert covered.tolist() == [True, False, True, True, False]
+
+    # Inputs broadcast, e.g. a row of x values against a column of y values
+    grid = analyzer.is_points_covered([[0, 4.5]], [[0], [3.5]])
+    assert grid.tolist() == [[True, False], [False, True]]
+
+    with pytest.raises(TypeError):
+        analyzer.is_points_covered(["3"], [0])
+
+    # Ints past the float64 range are outside every float rectangle
+    floats = RectangleAnalyzer([{"x": 0.5, "y": 0, "width": 1, "height": 1}])
+    covered = floats.is_points_covered([10**400, 1, -(10**400)], 0.5)
+    assert covered.tolist() == [False, True, False]
+
+    # Integer queries against int64 rectangles do not round, whatever the
+    # input dtype; NaN and values past int64 are simply not covered
+    analyzer = RectangleAnalyzer([{"x": 2**60 + 1, "y": 0, "width": 1, "height": 1}])
+    xs = [2**60, 2**60 + 1, 2**60 + 2, 2**70]
+    covered = analyzer.is_points_covered(xs, 0.5)
+    assert covered.tolist() == [False, True, True, False]
+    covered = analyzer.is_points_covered(np.array(xs[:3], dtype=np.uint64), 1)
+    assert covered.tolist() == [False, True, True]
+    covered = analyzer.is_points_covered([float(2**60), 1e30], [0.5, float("nan")])
+    assert covered.tolist() == [False, False]
+
 
 def test_find_max_overlap_point():
     """Test finding maximum overlap point."""
@@ -75,6 +213,21 @@ def test_find_max_overlap_point():
     assert 1 <= hotspot["y"] < 3
 
 
+def test_find_max_overlap_point_three_deep():
+    """Test the hotspot lands in the region shared by three rectangles."""
+    rectangles = [
+        {"x": 0, "y": 0, "width": 6, "height": 6},
+        {"x": 3, "y": 3, "width": 6, "height": 6},
+        {"x": 4, "y": 1, "width": 1, "height": 7},
+        {"x": 10, "y": 10, "width": 1, "height": 1},
+    ]
+    analyzer = RectangleAnalyzer(rectangles)
+    hotspot = analyzer.find_max_overlap_point()
+    assert hotspot["count"] == 3
+    assert 4 <= hotspot["x"] <= 5
+    assert 3 <= hotspot["y"] <= 6
+
+
 def test_get_stats():
     """Test getting coverage statistics."""
     rectangles = [
@@ -91,6 +244,92 @@ def test_get_stats():
     assert stats["coverage_efficiency"] == pytest.approx(17.0 / 21.0)
 
 
+def test_cached_results_are_not_shared():
+    """Test repeated queries are stable even if callers mutate results."""
+    rectangles = [
+        {"x": 0, "y": 0, "width": 4, "height": 3},
+        {"x": 2, "y": 1, "width": 3, "height": 3},
+    ]
+    analyzer = RectangleAnalyzer(rectangles)
+
+    analyzer.find_overlaps().append((5, 6))
+    analyzer.get_overlap_regions()[0]["region"]["width"] = 100
+    analyzer.find_max_overlap_point()["count"] = 100
+
+    assert analyzer.find_overlaps() == [(0, 1)]
+    assert analyzer.get_overlap_regions()[0]["region"]["width"] == 2
+    assert analyzer.find_max_overlap_point()["count"] == 2
+    assert analyzer.get_stats() == analyzer.get_stats()
+
+
+def test_integer_rectangles_stay_exact():
+    """Test integer input keeps integer regions and does not overflow."""
+    rectangles = [
+        {"x": 0, "y": 0, "width": 70000, "height": 70000},
+        {"x": 1, "y": 1, "width": 70000, "height": 70000},
+    ]
+    analyzer = RectangleAnalyzer(rectangles)
+    region = analyzer.get_overlap_regions()[0]["region"]
+    assert region == {"x": 1, "y": 1, "width": 69999, "height": 69999}
+    assert all(type(value) is int for value in region.values())
+
+    stats = analyzer.get_stats()
+    assert stats["overlap_area"] == 69999.0**2
+    assert stats["total_area"] == 2 * 70000.0**2 - 69999.0**2
+
+    # Coordinates beyond 32 bits fall back to a wider integer type
+    far = [{"x": 2**40, "y": 0, "width": 3, "height": 1}]
+    assert RectangleAnalyzer(far).calculate_coverage_area() == 3.0
+
+    # Right edges at the top of the int64 range stay integer
+    edge = [{"x": 2**63 - 2, "y": 0, "width": 1, "height": 1}]
+    analyzer = RectangleAnalyzer(edge)
+    assert analyzer.calculate_coverage_area() == 1.0
+    assert analyzer.is_point_covered(2**63 - 2, 0.5) is True
+    assert analyzer.find_max_overlap_point()["count"] == 1
+
+    # Right edges past the int64 range must not wrap around; such input is
+    # stored as float64 like float input
+    past = [{"x": 2**63 - 4096, "y": 0, "width": 8192, "height": 1}]
+    assert RectangleAnalyzer(past).calculate_coverage_area() == 8192.0
+
+    # Ints past the float64 range cannot be stored at all
+    with pytest.raises(ValueError, match="Rectangle 1 has x beyond the float64 range"):
+        RectangleAnalyzer(
+            [
+                {"x": 0, "y": 0, "width": 1, "height": 1},
+                {"x": 10**400, "y": 0, "width": 1, "height": 1},
+            ]
+        )
+
+    # Edges within int64 but beyond float64 precision stay distinct
+    low = [{"x": -(2**63), "y": 0, "width": 1, "height": 1}]
+    assert RectangleAnalyzer(low).calculate_coverage_area() == 1.0
+
+    # Edges that fit in int32 with a width that does not
+    wide = [{"x": -(2**31), "y": 0, "width": 2**32 - 1, "height": 1}]
+    assert RectangleAnalyzer(wide).calculate_coverage_area() == 2**32 - 1
+
+    # Sweep edges spanning more than int32 holds must not wrap
+    tall = [
+        {"x": 0, "y": -(2**31), "width": 1, "height": 1},
+        {"x": 0, "y": -1, "width": 1, "height": 2**31 - 1},
+    ]
+    assert RectangleAnalyzer(tall).calculate_coverage_area() == 2**31
+
+
+def test_rectangles_attribute():
+    """Test rectangles is the caller's list and queries use construction data."""
+    rectangles = [{"x": 0, "y": 0, "width": 4, "height": 3}]
+    analyzer = RectangleAnalyzer(rectangles)
+    assert analyzer.rectangles is rectangles
+    assert analyzer.rectangles == rectangles
+
+    # Counts come from the arrays loaded at construction, like every query
+    assert analyzer.get_stats()["total_rectangles"] == 1
+    assert analyzer.calculate_coverage_area() == 12.0
+
+
 def test_empty_rectangles():
     """Test with empty rectangle list."""
     analyzer = RectangleAnalyzer([])
@@ -98,6 +337,7 @@ def test_empty_rectangles():
     assert analyzer.calculate_coverage_area() == 0.0
     assert analyzer.get_overlap_regions() == []
     assert analyzer.is_point_covered(0, 0) is False
+    assert analyzer.is_points_covered([0, 1], [0, 1]).tolist() == [False, False]
 
 
 def test_boundary_points():
@@ -147,6 +387,28 @@ def test_validation_errors():
     with pytest.raises(ValueError, match="negative dimensions"):
         RectangleAnalyzer([{"x": 0, "y": 0, "width": -2, "height": 2}])
 
+    # Zero area, reported with the offending index
+    with pytest.raises(ValueError, match="Rectangle 1 has zero area"):
+        RectangleAnalyzer(
+            [
+                {"x": 0, "y": 0, "width": 2, "height": 2},
+                {"x": 0, "y": 0, "width": 2, "height": 0},
+            ]
+        )
+
+    # Numeric-looking strings are still rejected
+    with pytest.raises(TypeError, match="Rectangle 0 has non-numeric x"):
+        RectangleAnalyzer([{"x": "0", "y": 0, "width": 2, "height": 2}])
+
+    # Ragged values get the same error, not NumPy's shape error
+    with pytest.raises(TypeError, match=r"Rectangle 0 has non-numeric x: \[1\]"):
+        RectangleAnalyzer(
+            [
+                {"x": [1], "y": 0, "width": 2, "height": 2},
+                {"x": 2, "y": 0, "width": 2, "height": 2},
+            ]
+        )
+
 
 def test_identical_rectangles_warning():
     """Test warning is issued for identical rectangles."""
@@ -170,5 +432,37 @@ def test_identical_rectangles_warning():
     assert stats["total_rectangles"] == 3
 
 
+def test_kernel_dispatch_prefers_current_build(monkeypatch):
+    """Test precompiled kernels are used only when built from this source."""
+    covers_point = analyzer_module._covers_point
+    max_depth = analyzer_module._max_depth
+    kernel = analyzer_module._kernel
+    build = types.SimpleNamespace(
+        source_hash=analyzer_module._source_hash,
+        covers_point_f8=covers_point.py_func,
+    )
+    monkeypatch.setitem(sys.modules, "_rect_kernels", build)
+    assert analyzer_module._load_aot_kernels() is build
+
+    # Dtypes or kernels missing from the build fall back to the JIT kernel
+    monkeypatch.setattr(analyzer_module, "_rect_kernels", build)
+    assert kernel(covers_point, np.float64) is covers_point.py_func
+    assert kernel(covers_point, np.int32) is covers_point
+    assert kernel(max_depth, np.float64) is max_depth
+
+    # A build stamped from other source is ignored
+    build.source_hash = lambda: analyzer_module._source_hash() + 1
+    assert analyzer_module._load_aot_kernels() is None
+
+    # With a build loaded, the JIT fallbacks are not compiled at import
+    lazy = analyzer_module._eager_njit("i8(i8)")(lambda value: value)
+    assert lazy.signatures == []
+
+    monkeypatch.setattr(analyzer_module, "_rect_kernels", None)
+    assert kernel(covers_point, np.float64) is covers_point
+    eager = analyzer_module._eager_njit("i8(i8)")(lambda value: value)
+    assert len(eager.signatures) == 1
+
+
 if __name__ == "__main__":
     pytest.main()